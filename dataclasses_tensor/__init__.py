@@ -1 +1,5 @@
-from .core import dataclass_tensor, config
+from .core import StructuredTensor, dataclass_tensor, config
+from .layout import OptionalColumns, UnionColumns
+from .prefetch import BatchPrefetcher
+from .data import TensorDataset, TensorIterableDataset, make_collate
+from .replay import ReplayBuffer
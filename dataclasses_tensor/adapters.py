@@ -4,58 +4,216 @@ class TensorAdapter:
     def zeros(self, size: int, dtype: str):
         raise NotImplemented()
     
-    def argmax(self, arr):
+    def argmax(self, arr, axis=None):
+        raise NotImplemented()
+
+    def cast(self, arr, type_):
         raise NotImplemented()
 
     def get(self, tensor, pos):
         raise NotImplemented()
 
+    def index(self, vals):
+        raise NotImplemented()
+
+    def array(self, vals, like):
+        raise NotImplemented()
+
+    def view(self, arr, shape):
+        raise NotImplemented()
+
+    def stack(self, arrs):
+        raise NotImplemented()
+
+    def from_numpy(self, arr):
+        raise NotImplemented()
+
+    def host(self, arr):
+        raise NotImplemented()
+
+    def dtype_name(self, dtype):
+        raise NotImplemented()
+
 try:
     import numpy as np
     class NumpyAdapter(TensorAdapter):
         def zeros(self, size: int, dtype: Union[str, 'np.dtype']):
             return np.zeros(size, dtype=dtype)
 
-        def argmax(self, arr):
-            return np.argmax(arr)
+        def argmax(self, arr, axis=None):
+            return np.argmax(arr, axis=axis)
+
+        def cast(self, arr, type_):
+            return arr.astype(type_)
 
         def get(self, arr, pos):
             return arr[pos]
+
+        def index(self, vals):
+            return np.asarray(vals, dtype=np.int64)
+
+        def array(self, vals, like):
+            return np.asarray(vals, dtype=like.dtype)
+
+        def view(self, arr, shape):
+            return arr.reshape(shape)
+
+        def stack(self, arrs):
+            return np.stack(arrs)
+
+        def from_numpy(self, arr):
+            return arr
+
+        def host(self, arr):
+            return arr
+
+        def dtype_name(self, dtype):
+            return np.dtype(dtype).name
+
+        def records_dtype(self, dtype, fields):
+            return np.dtype([(name, dtype, shape) for name, shape in fields])
+
+        def to_records(self, arr, fields):
+            dtype = self.records_dtype(arr.dtype, fields)
+            return arr.view(dtype).reshape(arr.shape[:-1])
+
+        def from_records(self, records):
+            dtype = records.dtype[0].base
+            arr = np.ascontiguousarray(records).view(dtype)
+            return arr.reshape(records.shape + (-1,))
 except ImportError:
     class NumpyAdapter(TensorAdapter):
         def zero(self, _size: int, _dtype: str):
             raise RuntimeError("numpy library is not installed")
         
-        def argmax(self, _arr):
+        def argmax(self, _arr, axis=None):
+            raise RuntimeError("numpy library is not installed")
+
+        def cast(self, _arr, _type):
             raise RuntimeError("numpy library is not installed")
         
         def get(self, _arr, _pos):
             raise RuntimeError("numpy library is not installed")
 
+        def index(self, _vals):
+            raise RuntimeError("numpy library is not installed")
+
+        def array(self, _vals, _like):
+            raise RuntimeError("numpy library is not installed")
+
+        def view(self, _arr, _shape):
+            raise RuntimeError("numpy library is not installed")
+
+        def stack(self, _arrs):
+            raise RuntimeError("numpy library is not installed")
+
+        def from_numpy(self, _arr):
+            raise RuntimeError("numpy library is not installed")
+
+        def host(self, _arr):
+            raise RuntimeError("numpy library is not installed")
+
+        def dtype_name(self, _dtype):
+            raise RuntimeError("numpy library is not installed")
+
+        def records_dtype(self, _dtype, _fields):
+            raise RuntimeError("numpy library is not installed")
+
+        def to_records(self, _arr, _fields):
+            raise RuntimeError("numpy library is not installed")
+
+        def from_records(self, _records):
+            raise RuntimeError("numpy library is not installed")
+
 _numpy_adapter = NumpyAdapter()
 
 try:
     import torch
+
+    _torch_types = {int: torch.int64, float: torch.float64, bool: torch.bool}
+
     class PyTorchAdapter(TensorAdapter):
         def zeros(self, size: int, dtype: Union[str, 'torch.dtype']):
             if isinstance(dtype, str):
                 dtype = torch.__getattribute__(dtype)
             return torch.zeros(size, dtype=dtype)
 
-        def argmax(self, arr):
-            return torch.argmax(arr)
+        def argmax(self, arr, axis=None):
+            return torch.argmax(arr, dim=axis)
+
+        def cast(self, arr, type_):
+            return arr.to(_torch_types[type_])
 
         def get(self, arr, pos):
             return arr[pos].item()
+
+        def index(self, vals):
+            return torch.as_tensor(vals, dtype=torch.long)
+
+        def array(self, vals, like):
+            return torch.as_tensor(vals, dtype=like.dtype)
+
+        def view(self, arr, shape):
+            return arr.view(shape)
+
+        def stack(self, arrs):
+            return torch.stack(arrs)
+
+        def from_numpy(self, arr):
+            return torch.from_numpy(arr)
+
+        def host(self, arr):
+            if isinstance(arr, torch.Tensor):
+                return arr.detach().cpu()
+            # rows might be given one by one with an iterable
+            return map(self.host, arr)
+
+        def dtype_name(self, dtype):
+            if isinstance(dtype, str) and isinstance(getattr(torch, dtype, None), torch.dtype):
+                dtype = getattr(torch, dtype)
+            if isinstance(dtype, torch.dtype):
+                return str(dtype)[len("torch."):]
+            # NumPy dtypes and types, e.g. np.uint8
+            import numpy as np
+            return np.dtype(dtype).name
 except ImportError:
     class PyTorchAdapter(TensorAdapter):
         def zero(self, _size: int, _dtype: str):
             raise RuntimeError("torch library is not installed")
         
-        def argmax(self, _arr):
+        def argmax(self, _arr, axis=None):
+            raise RuntimeError("torch library is not installed")
+
+        def cast(self, _arr, _type):
             raise RuntimeError("torch library is not installed")
 
         def get(self, _arr, _pos):
             raise RuntimeError("torch library is not installed")
 
+        def index(self, _vals):
+            raise RuntimeError("torch library is not installed")
+
+        def array(self, _vals, _like):
+            raise RuntimeError("torch library is not installed")
+
+        def view(self, _arr, _shape):
+            raise RuntimeError("torch library is not installed")
+
+        def stack(self, _arrs):
+            raise RuntimeError("torch library is not installed")
+
+        def from_numpy(self, _arr):
+            raise RuntimeError("torch library is not installed")
+
+        def host(self, _arr):
+            raise RuntimeError("torch library is not installed")
+
+        def dtype_name(self, _dtype):
+            raise RuntimeError("torch library is not installed")
+
 _pytorch_adapter = PyTorchAdapter()
+
+_adapters = {
+    "numpy": _numpy_adapter,
+    "torch": _pytorch_adapter,
+}
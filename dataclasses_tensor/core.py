@@ -1,11 +1,17 @@
 import abc
 
-from typing import Iterable, Optional, Type, Union
+from collections import OrderedDict
+from typing import Any, Iterable, Mapping, NamedTuple, Optional, Type, Union
 
 from .adapters import (TensorAdapter, _numpy_adapter, _pytorch_adapter)
-from .layout import (TensorLayout, _dataclass_layout)
+from .layout import (BufferLayout, TensorLayout, _dataclass_layout)
 from .utils import hybridmethod
 
+class StructuredTensor(NamedTuple):
+    # flat tensor and views into it shaped per top-level field
+    tensor: object
+    fields: OrderedDict
+
 class DataClassTensorMixin(abc.ABC):
     @hybridmethod 
     def to_numpy(cls,
@@ -15,27 +21,73 @@ class DataClassTensorMixin(abc.ABC):
                  tensor_layout: Optional[Type[TensorLayout]] = None,
                  dtype = None,
                  batch: bool = False,
-                 batch_size: Optional[int] = None):
+                 batch_size: Optional[int] = None,
+                 structured: bool = False,
+                 multi_buffer: bool = False):
         layout = tensor_layout or cls.tensor_layout()
         return _to_tensor(_numpy_adapter,
                           layout,
                           obj or self,
                           dtype=cls._resolve_dtype(dtype),
                           batch=batch,
-                          batch_size=batch_size)
+                          batch_size=batch_size,
+                          structured=structured,
+                          multi_buffer=multi_buffer)
 
     @classmethod
     def from_numpy(cls, 
                    tensor,
                    *,
                    tensor_layout: Optional[Type[TensorLayout]]=None,
+                   dtype = None,
                    batch: bool = False,
-                   batch_size: Optional[int] = None):
+                   batch_size: Optional[int] = None,
+                   columnar: bool = False):
         return _from_tensor(_numpy_adapter,
                             tensor_layout or cls.tensor_layout(),
                             tensor,
+                            dtype=cls._resolve_dtype(dtype),
+                            batch=batch,
+                            batch_size=batch_size,
+                            columnar=columnar)
+
+    @hybridmethod
+    def to_records(cls,
+                   self,
+                   obj=None,
+                   *,
+                   tensor_layout: Optional[Type[TensorLayout]] = None,
+                   dtype = None,
+                   batch: bool = False,
+                   batch_size: Optional[int] = None):
+        layout = tensor_layout or cls.tensor_layout()
+        tensor = _to_tensor(_numpy_adapter,
+                            layout,
+                            obj or self,
+                            dtype=cls._resolve_dtype(dtype),
                             batch=batch,
                             batch_size=batch_size)
+        fields = [(k, elem.shape()) for k, elem in layout.elems.items()]
+        return _numpy_adapter.to_records(tensor, fields)
+
+    @classmethod
+    def from_records(cls,
+                     records,
+                     *,
+                     tensor_layout: Optional[Type[TensorLayout]] = None):
+        layout = tensor_layout or cls.tensor_layout()
+        if records.dtype.names != tuple(layout.elems.keys()):
+            raise ValueError(f"{records.dtype} does not match {cls.__name__} fields")
+        # any single base dtype, but shapes of fields should match the layout
+        fields = [(k, elem.shape()) for k, elem in layout.elems.items()]
+        expected = _numpy_adapter.records_dtype(records.dtype[0].base, fields)
+        if records.dtype != expected:
+            raise ValueError(f"{records.dtype} does not match {cls.__name__} "
+                             f"layout, expected {expected}")
+        return _from_tensor(_numpy_adapter,
+                            layout,
+                            _numpy_adapter.from_records(records),
+                            batch=records.ndim > 0)
 
     @hybridmethod
     def to_torch(cls,
@@ -45,31 +97,45 @@ class DataClassTensorMixin(abc.ABC):
                  tensor_layout: Optional[Type[TensorLayout]] = None,
                  dtype = None,
                  batch: bool = False,
-                 batch_size: Optional[int] = None):
+                 batch_size: Optional[int] = None,
+                 structured: bool = False,
+                 multi_buffer: bool = False):
         layout = tensor_layout or cls.tensor_layout()
         return _to_tensor(_pytorch_adapter,
                           layout,
                           obj or self,
                           dtype=cls._resolve_dtype(dtype),
                           batch=batch,
-                          batch_size=batch_size)
+                          batch_size=batch_size,
+                          structured=structured,
+                          multi_buffer=multi_buffer)
 
     @classmethod
     def from_torch(cls,
                    tensor,
                    *,
                    tensor_layout: Optional[Type[TensorLayout]] = None,
+                   dtype = None,
                    batch: bool = False,
-                   batch_size: Optional[int] = None):
+                   batch_size: Optional[int] = None,
+                   columnar: bool = False):
         return _from_tensor(_pytorch_adapter,
                             tensor_layout or cls.tensor_layout(),
                             tensor,
+                            dtype=cls._resolve_dtype(dtype),
                             batch=batch,
-                            batch_size=batch_size)
+                            batch_size=batch_size,
+                            columnar=columnar)
 
     @classmethod
     def tensor_layout(cls):
-        return _dataclass_layout(cls)
+        # computed once per class, this also keeps layout caches configured
+        # with `config(cache=...)` or `config(intern=...)` between calls
+        layout = cls.__dict__.get("_tensor_layout", None)
+        if layout is None:
+            layout = _dataclass_layout(cls)
+            cls._tensor_layout = layout
+        return layout
 
     @classmethod
     def _resolve_dtype(cls, dtype):
@@ -94,6 +160,8 @@ def dataclass_tensor(_cls=None, *, dtype="float32"):
 def _process_class(cls, dtype):
     cls.to_numpy = hybridmethod(DataClassTensorMixin.to_numpy.__func__)
     cls.from_numpy = classmethod(DataClassTensorMixin.from_numpy.__func__)
+    cls.to_records = hybridmethod(DataClassTensorMixin.to_records.__func__)
+    cls.from_records = classmethod(DataClassTensorMixin.from_records.__func__)
     cls.to_torch = hybridmethod(DataClassTensorMixin.to_torch.__func__)
     cls.from_torch = classmethod(DataClassTensorMixin.from_torch.__func__)
     cls.tensor_layout = classmethod(DataClassTensorMixin.tensor_layout.__func__)
@@ -102,8 +170,24 @@ def _process_class(cls, dtype):
     DataClassTensorMixin.register(cls)
     return cls
 
-def config(shape: Optional[Iterable[int]]):
-    return {"shape": shape}
+def config(shape: Optional[Iterable[int]] = None,
+           *,
+           union: Optional[str] = None,
+           dtype: Any = None,
+           cache: Optional[int] = None,
+           intern: Optional[int] = None):
+    metadata = {}
+    if shape is not None:
+        metadata["shape"] = shape
+    if union is not None:
+        metadata["union"] = union
+    if dtype is not None:
+        metadata["dtype"] = dtype
+    if cache is not None:
+        metadata["cache"] = cache
+    if intern is not None:
+        metadata["intern"] = intern
+    return metadata
 
 def _to_tensor(adapter: TensorAdapter,
                layout: Type[TensorLayout],
@@ -111,33 +195,125 @@ def _to_tensor(adapter: TensorAdapter,
                *,
                dtype="float",
                batch: bool = False,
-               batch_size: Optional[int] = None):
+               batch_size: Optional[int] = None,
+               structured: bool = False,
+               multi_buffer: bool = False):
+    if structured and multi_buffer:
+        raise ValueError("structured and multi_buffer could not be used together")
     batch = batch or batch_size is not None
     shape = len(layout)
     if batch:
         batch_size = batch_size or (len(val) if hasattr(val, "__len__") else 0)
-        if batch_size == 0:
-            val = list(val)
-            batch_size = len(val)
+        val = list(val)
+        batch_size = batch_size or len(val)
         shape = (batch_size, shape)
+    if multi_buffer:
+        return _to_buffers(adapter,
+                           BufferLayout(adapter, layout, dtype),
+                           val,
+                           batch_size=batch_size if batch else None)
     tensor = adapter.zeros(shape, dtype=dtype)
     if not batch:
         layout.write(adapter, 0, tensor, val)
     else:
-        for i, vi in enumerate(val):
-            layout.write(adapter, 0, tensor[i], vi)
+        _write_batch(adapter, layout, tensor, val)
+    if structured:
+        return StructuredTensor(tensor, _structured_views(adapter, layout, tensor))
     return tensor
 
+def _structured_views(adapter: TensorAdapter,
+                      layout: Type[TensorLayout],
+                      tensor):
+    batch_shape = tuple(tensor.shape[:-1])
+    views = OrderedDict()
+    for ((k, elem), elem_pos) in zip(layout.elems.items(), layout.positions):
+        elem_tensor = tensor[..., elem_pos:elem_pos+len(elem)]
+        views[k] = adapter.view(elem_tensor, batch_shape + elem.shape())
+    return views
+
+def _write_batch(adapter: TensorAdapter,
+                 layout: Type[TensorLayout],
+                 tensor,
+                 vals):
+    if vals:
+        layout.write_batch(adapter, 0, tensor, list(range(len(vals))), vals)
+
+def _to_buffers(adapter: TensorAdapter,
+                buffer_layout: BufferLayout,
+                val,
+                *,
+                batch_size: Optional[int] = None):
+    buffers = OrderedDict()
+    for dtype, size in buffer_layout.sizes.items():
+        shape = size if batch_size is None else (batch_size, size)
+        buffers[dtype] = adapter.zeros(shape, dtype=dtype)
+    if batch_size is None:
+        buffer_layout.write(adapter, buffers, val)
+    elif val:
+        buffer_layout.write_batch(adapter, buffers, list(range(len(val))), val)
+    return buffers
+
+def _from_buffers(adapter: TensorAdapter,
+                  buffer_layout: BufferLayout,
+                  buffers: Mapping,
+                  *,
+                  batch: bool = False):
+    if not batch:
+        return buffer_layout.read(adapter, buffers)
+    result = []
+    dtypes = list(buffers.keys())
+    for row in zip(*buffers.values()):
+        result.append(buffer_layout.read(adapter, dict(zip(dtypes, row))))
+    return result
+
+def _match_buffer_layout(adapter: TensorAdapter,
+                         layout: Type[TensorLayout],
+                         buffers: Mapping,
+                         dtype):
+    # buffers encoded with another default dtype are keyed by it, so keys
+    # are tried as the default dtype when the given one does not fit
+    dtype = adapter.dtype_name(dtype)
+    for candidate in [dtype] + [k for k in buffers.keys() if k != dtype]:
+        try:
+            buffer_layout = BufferLayout(adapter, layout, candidate)
+        except ValueError:
+            continue
+        if set(buffer_layout.sizes) == set(buffers.keys()) and all(
+            buffers[k].shape[-1] == size for k, size in buffer_layout.sizes.items()
+        ):
+            return buffer_layout
+    expected = list(BufferLayout(adapter, layout, dtype).sizes.keys())
+    raise ValueError(f"buffers with dtypes {list(buffers.keys())} do not match "
+                     f"the layout, expected dtypes {expected}")
+
 def _from_tensor(adapter: TensorAdapter,
                  layout: Type[TensorLayout],
                  tensor,
                  *,
+                 dtype="float",
                  batch: bool = False,
-                 batch_size: Optional[int] = None):
+                 batch_size: Optional[int] = None,
+                 columnar: bool = False):
+    if isinstance(tensor, StructuredTensor):
+        tensor = tensor.tensor
     batch = batch or batch_size is not None
+    if columnar:
+        if isinstance(tensor, Mapping):
+            raise ValueError("columnar could not be used with multi_buffer output")
+        return layout.read_columns(adapter, 0, tensor)
+    # decoding reads element by element, move to host once instead of
+    # synchronizing with the device on each read
+    if isinstance(tensor, Mapping):
+        buffers = OrderedDict((adapter.dtype_name(k), adapter.host(v))
+                              for k, v in tensor.items())
+        return _from_buffers(adapter,
+                             _match_buffer_layout(adapter, layout, buffers, dtype),
+                             buffers,
+                             batch=batch)
     if not batch:
-        return layout.read(adapter, 0, tensor)
+        return layout.read(adapter, 0, adapter.host(tensor))
     batch_size = batch_size or (len(tensor) if hasattr(tensor, "__len__") else 0)
+    tensor = adapter.host(tensor)
     result = [None]*batch_size
     if batch_size != 0:
         for i, t in enumerate(tensor):
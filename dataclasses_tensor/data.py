@@ -0,0 +1,89 @@
+from itertools import islice
+from typing import Iterable, Optional, Sequence, Type
+
+from .adapters import _pytorch_adapter
+from .core import _to_tensor
+from .layout import TensorLayout
+
+class _Collate:
+    # a class rather than a closure to stay picklable for worker processes
+    def __init__(self, layout: Type[TensorLayout], dtype):
+        self.layout = layout
+        self.dtype = dtype
+
+    def __call__(self, vals):
+        return _to_tensor(_pytorch_adapter,
+                          self.layout,
+                          vals,
+                          dtype=self.dtype,
+                          batch=True)
+
+def make_collate(cls: type,
+                 *,
+                 tensor_layout: Optional[Type[TensorLayout]] = None,
+                 dtype = None):
+    """
+    Creates `collate_fn` for `torch.utils.data.DataLoader` that encodes
+    a list of dataclass instances into a single `(batch, width)` tensor.
+    The layout is computed once and reused for all batches.
+    """
+    return _Collate(tensor_layout or cls.tensor_layout(),
+                    cls._resolve_dtype(dtype))
+
+try:
+    from torch.utils.data import Dataset, IterableDataset, get_worker_info
+
+    class TensorDataset(Dataset):
+        """
+        Map-style dataset over a sequence of dataclass instances. Items are
+        encoded in bulk by `collate_fn`, pass it to the `DataLoader`.
+        """
+
+        def __init__(self,
+                     data: Sequence,
+                     cls: type,
+                     *,
+                     tensor_layout: Optional[Type[TensorLayout]] = None,
+                     dtype = None):
+            self.data = data
+            self.collate_fn = make_collate(cls,
+                                           tensor_layout=tensor_layout,
+                                           dtype=dtype)
+
+        def __len__(self):
+            return len(self.data)
+
+        def __getitem__(self, index):
+            return self.data[index]
+
+    class TensorIterableDataset(IterableDataset):
+        """
+        Iterable-style dataset over a source of dataclass instances. When
+        loaded with multiple workers, each worker takes every `num_workers`-th
+        element of the source so no element is produced twice.
+        """
+
+        def __init__(self,
+                     iterable: Iterable,
+                     cls: type,
+                     *,
+                     tensor_layout: Optional[Type[TensorLayout]] = None,
+                     dtype = None):
+            self.iterable = iterable
+            self.collate_fn = make_collate(cls,
+                                           tensor_layout=tensor_layout,
+                                           dtype=dtype)
+
+        def __iter__(self):
+            worker = get_worker_info()
+            if worker is None:
+                return iter(self.iterable)
+            return islice(self.iterable, worker.id, None, worker.num_workers)
+except ImportError:
+    class TensorDataset:
+        def __init__(self, *_args, **_kwargs):
+            raise RuntimeError("torch library is not installed")
+
+    class TensorIterableDataset:
+        def __init__(self, *_args, **_kwargs):
+            raise RuntimeError("torch library is not installed")
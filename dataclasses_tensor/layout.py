@@ -2,20 +2,50 @@ from collections import OrderedDict
 from dataclasses import dataclass, field, fields, is_dataclass
 from enum import Enum
 from itertools import zip_longest
-from typing import List, Tuple, Type, Union
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Type, Union
 
-from .utils import (_is_list, _is_optional, _issubclass_safe, _is_union)
+from .utils import (LRUCache, _is_list, _is_optional, _issubclass_safe, _is_union)
 
 class TensorLayout:
     def __len__(self):
         raise NotImplementedError()
 
+    def shape(self) -> Tuple[int, ...]:
+        return (len(self),)
+
     def read(self, adapter, pos, tensor, argmax=None):
         raise NotImplementedError()
 
+    def signature(self, adapter, pos, tensor, argmax=None):
+        # hashable value that equals for segments decoded into equal values,
+        # see `config(intern=...)`
+        raise NotImplementedError()
+
     def write(self, adapter, pos, tensor, val):
         raise NotImplementedError()
 
+    def read_columns(self, adapter, pos, tensor):
+        # reads all rows of a tensor of shape (..., width) at once,
+        # see `from_numpy(columnar=True)`
+        raise NotImplementedError()
+
+    def write_batch(self, adapter, pos, tensor, rows, vals):
+        # `rows` are indices into the first dimension of the tensor that
+        # correspond to `vals`, subclasses write them in bulk
+        for row, val in zip(rows, vals):
+            self.write(adapter, pos, tensor[row], val)
+
+class OptionalColumns(NamedTuple):
+    # `mask` is True for rows with None, `value` is only valid elsewhere
+    mask: Any
+    value: Any
+
+class UnionColumns(NamedTuple):
+    # option index per row, columns of each option are only valid
+    # for rows where it's selected
+    selector: Any
+    options: Tuple[Any, ...]
+
 @dataclass
 class ChunkPrimitive(TensorLayout):
     elem: Union[int, float, bool]
@@ -23,33 +53,65 @@ class ChunkPrimitive(TensorLayout):
     def __len__(self):
         return 1
 
+    def shape(self):
+        return ()
+
     def write(self, _adapter, pos, tensor, val):
         tensor[pos] = val
 
+    def write_batch(self, adapter, pos, tensor, rows, vals):
+        tensor[adapter.index(rows), pos] = adapter.array(vals, tensor)
+
     def read(self, adapter, pos, tensor, argmax=None):
         return self.elem(adapter.get(tensor, pos))
 
+    def signature(self, adapter, pos, tensor, argmax=None):
+        return self.read(adapter, pos, tensor)
+
+    def read_columns(self, adapter, pos, tensor):
+        return adapter.cast(tensor[..., pos], self.elem)
+
 @dataclass
 class ChunkEnum(TensorLayout):
     elem: Enum
+    # computed once instead of listing enum members on each call
+    options: Tuple[Enum, ...] = field(init=False, repr=False, compare=False)
+    positions: Dict[Enum, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.options = tuple(self.elem)
+        self.positions = {option: i for i, option in enumerate(self.options)}
 
     def __len__(self):
-        return len(self.elem)
+        return len(self.options)
+
+    def _position(self, val):
+        try:
+            return self.positions[val]
+        except (KeyError, TypeError):
+            raise ValueError(f"{val} is not a valid option for {self.elem} enum") from None
 
     def write(self, _adapter, pos, tensor, val):
-        for i, option in enumerate(list(self.elem)):
-            if val == option:
-                # here we rely on 1. being automatically converted to 1 
-                # when working with int or long tensor dtype
-                tensor[pos+i] = 1.
-                return
-        raise ValueError(f"{val} is not a valid option for {self.elem} enum") 
+        # here we rely on 1. being automatically converted to 1 
+        # when working with int or long tensor dtype
+        tensor[pos+self._position(val)] = 1.
+
+    def write_batch(self, adapter, pos, tensor, rows, vals):
+        cols = [pos + self._position(val) for val in vals]
+        tensor[adapter.index(rows), adapter.index(cols)] = 1.
 
     def read(self, adapter, pos, tensor, argmax=None):
-        options = list(self.elem)
         # might be already computed previously (e.g. in case of Optional)
-        if argmax is not None: return options[argmax]
-        return options[adapter.argmax(tensor[pos:pos+len(self)])]
+        if argmax is not None: return self.options[argmax]
+        return self.options[adapter.argmax(tensor[pos:pos+len(self)])]
+
+    def signature(self, adapter, pos, tensor, argmax=None):
+        if argmax is not None: return argmax
+        return int(adapter.argmax(tensor[pos:pos+len(self)]))
+
+    def read_columns(self, adapter, pos, tensor):
+        # indices of options, in the order of enum definition
+        return adapter.argmax(tensor[..., pos:pos+len(self)], axis=-1)
 
 @dataclass
 class ChunkOptional(TensorLayout):
@@ -64,11 +126,33 @@ class ChunkOptional(TensorLayout):
         else:
             self.elem.write(adapter, pos+1, tensor, val)
 
+    def write_batch(self, adapter, pos, tensor, rows, vals):
+        none_rows, elem_rows, elem_vals = [], [], []
+        for row, val in zip(rows, vals):
+            if val is None:
+                none_rows.append(row)
+            else:
+                elem_rows.append(row)
+                elem_vals.append(val)
+        if none_rows:
+            tensor[adapter.index(none_rows), pos] = 1.
+        if elem_rows:
+            self.elem.write_batch(adapter, pos+1, tensor, elem_rows, elem_vals)
+
     def read(self, adapter, pos, tensor, argmax=None):
         argmax = adapter.argmax(tensor[pos:pos+len(self)])
         if argmax == 0: return None
         return self.elem.read(adapter, pos+1, tensor, argmax=argmax-1)
 
+    def signature(self, adapter, pos, tensor, argmax=None):
+        argmax = int(adapter.argmax(tensor[pos:pos+len(self)]))
+        if argmax == 0: return None
+        return self.elem.signature(adapter, pos+1, tensor, argmax=argmax-1)
+
+    def read_columns(self, adapter, pos, tensor):
+        mask = adapter.argmax(tensor[..., pos:pos+len(self)], axis=-1) == 0
+        return OptionalColumns(mask, self.elem.read_columns(adapter, pos+1, tensor))
+
 
 @dataclass
 class ChunkCollection(TensorLayout):
@@ -78,11 +162,57 @@ class ChunkCollection(TensorLayout):
     def __len__(self):
         return self.num * len(self.elem)
 
+    def shape(self):
+        return (self.num,) + self.elem.shape()
+
     def write(self, adapter, pos, tensor, val):
+        if _cached_dataclass(self.elem) is not None:
+            val = list(val)
+            if len(val) <= self.num and self._write_cached(adapter, pos, tensor, None, [val]):
+                return
         elem_size = len(self.elem)
         for i, elem_val in zip_longest(range(self.num), val):
             self.elem.write(adapter, pos + i*elem_size, tensor, elem_val)
 
+    def write_batch(self, adapter, pos, tensor, rows, vals):
+        vals = [list(val) for val in vals]
+        if any(len(val) > self.num for val in vals):
+            raise ValueError(f"Collection has more than {self.num} elements")
+        if _cached_dataclass(self.elem) is not None and rows:
+            if self._write_cached(adapter, pos, tensor, rows, vals):
+                return
+        elem_size = len(self.elem)
+        for i in range(self.num):
+            elem_vals = [val[i] if i < len(val) else None for val in vals]
+            self.elem.write_batch(adapter, pos + i*elem_size, tensor, rows, elem_vals)
+
+    def _write_cached(self, adapter, pos, tensor, rows, vals):
+        # one lookup per distinct element over all rows and positions instead
+        # of one per position, then the whole region is written at once;
+        # `rows` is None for a single instance, returns False when some
+        # element is unhashable
+        cached = _cached_dataclass(self.elem)
+        distinct, elem_index = {}, []
+        for val in vals:
+            for i in range(self.num):
+                elem_val = val[i] if i < len(val) else None
+                key = None if elem_val is None else cached._cache_key(elem_val)
+                try:
+                    elem_index.append(distinct.setdefault(key, (len(distinct), elem_val))[0])
+                except TypeError:
+                    return False
+        segments = []
+        for _, elem_val in distinct.values():
+            segment = adapter.zeros(len(self.elem), dtype=tensor.dtype)
+            self.elem.write(adapter, 0, segment, elem_val)
+            segments.append(segment)
+        segments = adapter.stack(segments)[adapter.index(elem_index)]
+        if rows is None:
+            tensor[pos:pos+len(self)] = adapter.view(segments, (len(self),))
+        else:
+            tensor[adapter.index(rows), pos:pos+len(self)] = adapter.view(segments, (len(rows), len(self)))
+        return True
+
     def read(self, adapter, pos, tensor, argmax=None):
         # prepare array to avoid re-allocations 
         vals = [None]*self.num
@@ -91,18 +221,35 @@ class ChunkCollection(TensorLayout):
             vals[i] = self.elem.read(adapter, pos+i*elem_size, tensor)
         return vals
 
+    def signature(self, adapter, pos, tensor, argmax=None):
+        elem_size = len(self.elem)
+        return tuple(self.elem.signature(adapter, pos+i*elem_size, tensor)
+                     for i in range(self.num))
+
+    def read_columns(self, adapter, pos, tensor):
+        # elements become an additional axis right before the last one
+        elems = tensor[..., pos:pos+len(self)]
+        shape = tuple(elems.shape[:-1]) + (self.num, len(self.elem))
+        return self.elem.read_columns(adapter, 0, adapter.view(elems, shape))
+
 @dataclass
 class ChunkUnion(TensorLayout):
     elems: List[Tuple[type, Type[TensorLayout]]] = field(default_factory=list)
     cursor: int = 0
     positions: List[int] = field(default_factory=list)
     num_options: int = 0
+    # all options are written into the same region after the selector
+    shared: bool = False
 
     def add(self, cls: type, layout: Type[TensorLayout]):
-        self.positions.append(self.cursor)
         self.elems.append((cls, layout))
-        self.cursor += len(layout)
         self.num_options += 1
+        if self.shared:
+            self.positions.append(0)
+            self.cursor = max(self.cursor, len(layout))
+        else:
+            self.positions.append(self.cursor)
+            self.cursor += len(layout)
 
     def __len__(self):
         return self.cursor + self.num_options
@@ -112,15 +259,50 @@ class ChunkUnion(TensorLayout):
             if isinstance(val, cls):
                 tensor[pos+option] = 1.
                 elem_pos = self.positions[option]
-                elem.write(adapter, self.num_options+elem_pos, tensor, val)
+                elem.write(adapter, pos+self.num_options+elem_pos, tensor, val)
                 return
         raise ValueError(f"{type(val)} is not compatible with Union arguments")
 
+    def write_batch(self, adapter, pos, tensor, rows, vals):
+        option_rows = [[] for _ in self.elems]
+        option_vals = [[] for _ in self.elems]
+        for row, val in zip(rows, vals):
+            for option, (cls, _) in enumerate(self.elems):
+                if isinstance(val, cls):
+                    option_rows[option].append(row)
+                    option_vals[option].append(val)
+                    break
+            else:
+                raise ValueError(f"{type(val)} is not compatible with Union arguments")
+        for option, (_, elem) in enumerate(self.elems):
+            if not option_rows[option]: continue
+            tensor[adapter.index(option_rows[option]), pos+option] = 1.
+            elem_pos = self.positions[option]
+            elem.write_batch(adapter,
+                             pos+self.num_options+elem_pos,
+                             tensor,
+                             option_rows[option],
+                             option_vals[option])
+
     def read(self, adapter, pos, tensor, argmax=None):
         option = adapter.argmax(tensor[pos:pos+self.num_options])
         elem_pos = self.positions[option]
         _, elem = self.elems[option]
-        return elem.read(adapter, self.num_options+elem_pos, tensor) 
+        return elem.read(adapter, pos+self.num_options+elem_pos, tensor)
+
+    def signature(self, adapter, pos, tensor, argmax=None):
+        option = int(adapter.argmax(tensor[pos:pos+self.num_options]))
+        elem_pos = self.positions[option]
+        _, elem = self.elems[option]
+        return (option, elem.signature(adapter, pos+self.num_options+elem_pos, tensor))
+
+    def read_columns(self, adapter, pos, tensor):
+        selector = adapter.argmax(tensor[..., pos:pos+self.num_options], axis=-1)
+        options = tuple(
+            elem.read_columns(adapter, pos+self.num_options+elem_pos, tensor)
+            for (_, elem), elem_pos in zip(self.elems, self.positions)
+        )
+        return UnionColumns(selector, options)
 
 @dataclass
 class ChunkDataclass(TensorLayout):
@@ -128,26 +310,161 @@ class ChunkDataclass(TensorLayout):
     cursor: int = 0
     elems: OrderedDict = field(default_factory=OrderedDict)
     positions: List[int] = field(default_factory=list)
-
-    def add(self, name: str, layout: Type[TensorLayout]):
+    # dtypes from fields config, only used for multi-buffer output
+    dtypes: List[Any] = field(default_factory=list)
+    # encoded segments of hashable values, see `config(cache=...)`
+    cache: Optional[LRUCache] = None
+    cache_exact_keys: bool = False
+    # decoded instances of frozen dataclasses, see `config(intern=...)`
+    interned: Optional[LRUCache] = None
+
+    def add(self, name: str, layout: Type[TensorLayout], dtype=None):
         self.positions.append(self.cursor)
         self.elems[name] = layout
+        self.dtypes.append(dtype)
         self.cursor += len(layout)
 
     def __len__(self):
         return self.cursor
     
+    def cache_info(self):
+        return self.cache.cache_info() if self.cache is not None else None
+
+    def intern_info(self):
+        return self.interned.cache_info() if self.interned is not None else None
+
+    def _cache_key(self, val):
+        # equal values only encode differently when a Union picks an option
+        # by type (True == 1 in Union[bool, int]) or a nested mutable value
+        # changed, exact keys are slower
+        return _exact_key(val) if self.cache_exact_keys else val
+
+    def _cached_segment(self, adapter, tensor, val):
+        # returns None for values with unhashable leaves, those are not cached
+        key = (type(tensor), tensor.dtype, self._cache_key(val))
+        try:
+            segment = self.cache.get(key)
+        except TypeError:
+            return None
+        if segment is None:
+            segment = adapter.zeros(len(self), dtype=tensor.dtype)
+            self._write(adapter, 0, segment, val)
+            self.cache.put(key, segment)
+        return segment
+
     def write(self, adapter, pos, tensor, val):
+        if self.cache is not None:
+            segment = self._cached_segment(adapter, tensor, val)
+            if segment is not None:
+                tensor[pos:pos+len(self)] = segment
+                return
+        self._write(adapter, pos, tensor, val)
+
+    def _write(self, adapter, pos, tensor, val):
         for ((k, elem), elem_pos) in zip(self.elems.items(), self.positions):
             elem.write(adapter, pos+elem_pos, tensor, getattr(val, k))
 
+    def write_batch(self, adapter, pos, tensor, rows, vals):
+        if self.cache is not None:
+            # one lookup per distinct value, then all rows are written
+            # with a single gather from the stacked segments
+            distinct = {}
+            cached_rows, segment_index = [], []
+            uncached_rows, uncached_vals = [], []
+            for row, val in zip(rows, vals):
+                try:
+                    i = distinct.setdefault(self._cache_key(val), (len(distinct), val))[0]
+                except TypeError:
+                    uncached_rows.append(row)
+                    uncached_vals.append(val)
+                    continue
+                cached_rows.append(row)
+                segment_index.append(i)
+            if cached_rows:
+                segments = adapter.stack([self._cached_segment(adapter, tensor, val)
+                                          for _, val in distinct.values()])
+                segments = segments[adapter.index(segment_index)]
+                tensor[adapter.index(cached_rows), pos:pos+len(self)] = segments
+            if not uncached_rows: return
+            rows, vals = uncached_rows, uncached_vals
+        for ((k, elem), elem_pos) in zip(self.elems.items(), self.positions):
+            elem_vals = [getattr(val, k) for val in vals]
+            elem.write_batch(adapter, pos+elem_pos, tensor, rows, elem_vals)
+
     def read(self, adapter, pos, tensor, argmax=None):
+        if self.interned is None:
+            return self._read(adapter, pos, tensor)
+        # argmax of one-hot blocks rather than raw bytes, so that
+        # predictions decoded into equal values share the instance
+        key = self.signature(adapter, pos, tensor)
+        val = self.interned.get(key)
+        if val is None:
+            val = self._read(adapter, pos, tensor)
+            self.interned.put(key, val)
+        return val
+
+    def signature(self, adapter, pos, tensor, argmax=None):
+        return tuple(elem.signature(adapter, pos+elem_pos, tensor)
+                     for elem, elem_pos in zip(self.elems.values(), self.positions))
+
+    def _read(self, adapter, pos, tensor):
         kvs = {}
         for ((k, elem), elem_pos) in zip(self.elems.items(), self.positions):
             kvs[k] = elem.read(adapter, pos+elem_pos, tensor)
         return self.cls(**kvs)
 
+    def read_columns(self, adapter, pos, tensor):
+        columns = OrderedDict()
+        for ((k, elem), elem_pos) in zip(self.elems.items(), self.positions):
+            columns[k] = elem.read_columns(adapter, pos+elem_pos, tensor)
+        return columns
+
+def _needs_exact_keys(layout, nested=False):
+    # a Union picks an option by type, and a nested mutable dataclass might
+    # be hashable by identity while its fields change
+    if isinstance(layout, ChunkUnion):
+        return True
+    if isinstance(layout, ChunkDataclass):
+        if nested and not layout.cls.__dataclass_params__.frozen:
+            return True
+        return any(_needs_exact_keys(elem, True) for elem in layout.elems.values())
+    if isinstance(layout, (ChunkOptional, ChunkCollection)):
+        return _needs_exact_keys(layout.elem, nested)
+    return False
+
+def _nested_dtypes(layout):
+    # explicitly configured dtypes of all fields within the layout
+    if isinstance(layout, ChunkDataclass):
+        for elem, dtype in zip(layout.elems.values(), layout.dtypes):
+            if dtype is not None:
+                yield dtype
+            yield from _nested_dtypes(elem)
+    elif isinstance(layout, ChunkUnion):
+        for _, elem in layout.elems:
+            yield from _nested_dtypes(elem)
+    elif isinstance(layout, (ChunkOptional, ChunkCollection)):
+        yield from _nested_dtypes(layout.elem)
+
+def _cached_dataclass(layout):
+    # dataclass layout with encode cache, possibly wrapped into Optional
+    if isinstance(layout, ChunkOptional):
+        layout = layout.elem
+    if isinstance(layout, ChunkDataclass) and layout.cache is not None:
+        return layout
+    return None
+
+def _exact_key(val):
+    # values that compare equal might still be encoded differently (e.g.
+    # True == 1 in Union[bool, int]), so keys keep exact types of leaves
+    if is_dataclass(val) and not isinstance(val, type):
+        return (type(val),) + tuple(_exact_key(getattr(val, f.name)) for f in fields(val))
+    if isinstance(val, (list, tuple)):
+        return (type(val),) + tuple(_exact_key(v) for v in val)
+    return (type(val), val)
+
 def _type_layout(type_, metadata=None):
+    metadata = metadata or {}
+
     if type_ in (int, float, bool):
         return ChunkPrimitive(type_)
 
@@ -155,10 +472,12 @@ def _type_layout(type_, metadata=None):
         return ChunkEnum(type_)
     
     if is_dataclass(type_):
-        return _dataclass_layout(type_)
+        return _dataclass_layout(type_,
+                                 cache_size=metadata.get("cache", None),
+                                 intern_size=metadata.get("intern", None))
     
     if _is_optional(type_) and len(type_.__args__) == 2:
-        return ChunkOptional(_type_layout(type_.__args__[0]))
+        return ChunkOptional(_type_layout(type_.__args__[0], metadata))
     
     if _is_list(type_):
         arg = type_.__args__[0]
@@ -167,18 +486,104 @@ def _type_layout(type_, metadata=None):
             raise ValueError("Shape is not specified for a list field")
         if isinstance(shape, int):
             shape = [shape]
-        return ChunkCollection(shape[0], _type_layout(arg, {"shape": shape[1:]}))
+        elem_metadata = {**metadata, "shape": shape[1:]}
+        return ChunkCollection(shape[0], _type_layout(arg, elem_metadata))
     
     if _is_union(type_):
-        chunk = ChunkUnion()
+        union = metadata.get("union", None)
+        if union not in (None, "shared"):
+            raise ValueError(f"{union} is not a valid Union layout")
+        chunk = ChunkUnion(shared=union == "shared")
         for arg in type_.__args__:
-            chunk.add(arg, _type_layout(arg))
+            chunk.add(arg, _type_layout(arg, metadata))
         return chunk
 
     raise ValueError(f"{type_} type is not supported")
 
-def _dataclass_layout(cls):
+def _dataclass_layout(cls,
+                      cache_size: Optional[int] = None,
+                      intern_size: Optional[int] = None):
     dataclass_layout = ChunkDataclass(cls)
     for field in fields(cls):
-        dataclass_layout.add(field.name, _type_layout(field.type, field.metadata))
-    return dataclass_layout 
+        dataclass_layout.add(field.name,
+                             _type_layout(field.type, field.metadata),
+                             field.metadata.get("dtype", None))
+    if cache_size is not None:
+        # a mutated instance would otherwise get its stale cached encoding
+        if not cls.__dataclass_params__.frozen:
+            raise ValueError(f"{cls} should be frozen to cache encoded instances")
+        dataclass_layout.cache = LRUCache(cache_size)
+        dataclass_layout.cache_exact_keys = _needs_exact_keys(dataclass_layout)
+    if intern_size is not None:
+        # sharing decoded instances is only safe when they are immutable
+        if not cls.__dataclass_params__.frozen:
+            raise ValueError(f"{cls} should be frozen to intern decoded instances")
+        dataclass_layout.interned = LRUCache(intern_size)
+    return dataclass_layout
+
+class _Placement(NamedTuple):
+    elem: Type[TensorLayout]
+    dtype: Any
+    pos: int
+
+class _DataclassPlacement(NamedTuple):
+    cls: type
+    elems: List[Tuple[str, Any]]
+
+class BufferLayout:
+    """
+    Places leaves of a dataclass layout into one buffer per dtype. Fields
+    of nested dataclasses are placed independently, other types (arrays,
+    optionals, unions) go to a single buffer as a whole. Buffers are keyed
+    by dtype names, so that different specs of one dtype share a buffer.
+    """
+
+    def __init__(self, adapter, layout: ChunkDataclass, dtype):
+        self.adapter = adapter
+        self.sizes = OrderedDict()
+        self.root = self._place(layout, adapter.dtype_name(dtype))
+
+    def _place(self, elem, dtype):
+        if isinstance(elem, ChunkDataclass):
+            return _DataclassPlacement(elem.cls, [
+                (k, self._place(sub_elem, self.adapter.dtype_name(sub_dtype or dtype)))
+                for (k, sub_elem), sub_dtype in zip(elem.elems.items(), elem.dtypes)
+            ])
+        # arrays, optionals and unions are contiguous, so dataclasses within
+        # them could not place their fields into other buffers
+        for nested_dtype in _nested_dtypes(elem):
+            if self.adapter.dtype_name(nested_dtype) != dtype:
+                raise ValueError(f"dtype {nested_dtype} of a field within an array, "
+                                 f"optional or union conflicts with its buffer dtype {dtype}")
+        pos = self.sizes.get(dtype, 0)
+        self.sizes[dtype] = pos + len(elem)
+        return _Placement(elem, dtype, pos)
+
+    def write(self, adapter, buffers, val, placement=None):
+        if placement is None: placement = self.root
+        if isinstance(placement, _Placement):
+            elem, dtype, pos = placement
+            elem.write(adapter, pos, buffers[dtype], val)
+        else:
+            for k, sub_placement in placement.elems:
+                self.write(adapter, buffers, getattr(val, k), sub_placement)
+
+    def write_batch(self, adapter, buffers, rows, vals, placement=None):
+        if placement is None: placement = self.root
+        if isinstance(placement, _Placement):
+            elem, dtype, pos = placement
+            elem.write_batch(adapter, pos, buffers[dtype], rows, vals)
+        else:
+            for k, sub_placement in placement.elems:
+                sub_vals = [getattr(val, k) for val in vals]
+                self.write_batch(adapter, buffers, rows, sub_vals, sub_placement)
+
+    def read(self, adapter, buffers, placement=None):
+        if placement is None: placement = self.root
+        if isinstance(placement, _Placement):
+            elem, dtype, pos = placement
+            return elem.read(adapter, pos, buffers[dtype])
+        kvs = {}
+        for k, sub_placement in placement.elems:
+            kvs[k] = self.read(adapter, buffers, sub_placement)
+        return placement.cls(**kvs) 
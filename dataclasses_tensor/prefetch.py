@@ -0,0 +1,166 @@
+import asyncio
+import queue
+import threading
+
+from itertools import islice
+from typing import Iterable, Optional, Type
+
+from .adapters import _adapters
+from .core import _write_batch
+from .layout import TensorLayout
+
+_DONE = object()
+
+class _Failure:
+    def __init__(self, exc: BaseException):
+        self.exc = exc
+
+def _acquire(free: queue.Queue, stop: threading.Event):
+    while not stop.is_set():
+        try:
+            return free.get(timeout=0.1)
+        except queue.Empty:
+            continue
+    return None
+
+def _produce(it, adapter, layout, buffers, batch_size, free, ready, stop):
+    # module level and not a method, the thread must not keep the prefetcher
+    # alive or an abandoned one would never be collected and stopped
+    try:
+        while not stop.is_set():
+            vals = list(islice(it, batch_size))
+            if not vals:
+                break
+            i = _acquire(free, stop)
+            if i is None:
+                return
+            tensor = buffers[i]
+            tensor[:len(vals)] = 0
+            _write_batch(adapter, layout, tensor, vals)
+            ready.put((i, len(vals)))
+    except BaseException as e:
+        ready.put(_Failure(e))
+    finally:
+        ready.put(_DONE)
+
+class BatchPrefetcher:
+    """
+    Encodes batches from the iterable in a background thread into a ring
+    of `depth` preallocated tensors, so encoding of the next batches
+    overlaps with the consumer working on the current one. See example:
+
+    with BatchPrefetcher(states, Chess, 256, depth=2) as batches:
+        for batch in batches:
+            ...
+
+    The tensor returned is reused once the next batch is requested, copy
+    it if it has to outlive the iteration step. The last batch might be
+    shorter than `batch_size`. `close` waits up to `timeout` seconds for
+    the thread, which only stops once the source returns from `next()`.
+    """
+
+    def __init__(self,
+                 iterable: Iterable,
+                 cls: type,
+                 batch_size: int,
+                 *,
+                 depth: int = 2,
+                 target: str = "torch",
+                 tensor_layout: Optional[Type[TensorLayout]] = None,
+                 dtype = None):
+        if batch_size < 1:
+            raise ValueError("batch_size should be positive")
+        if depth < 1:
+            raise ValueError("depth should be positive")
+        if target not in _adapters:
+            raise ValueError(f"{target} is not a supported target")
+        self.batch_size = batch_size
+        self.depth = depth
+        self._adapter = _adapters[target]
+        self._layout = tensor_layout or cls.tensor_layout()
+        self._buffers = [
+            self._adapter.zeros((batch_size, len(self._layout)),
+                                dtype=cls._resolve_dtype(dtype))
+            for _ in range(depth)
+        ]
+        self._free = queue.Queue()
+        for i in range(depth):
+            self._free.put(i)
+        self._ready = queue.Queue()
+        self._held = None
+        self._closed = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=_produce,
+                                        args=(iter(iterable),
+                                              self._adapter,
+                                              self._layout,
+                                              self._buffers,
+                                              batch_size,
+                                              self._free,
+                                              self._ready,
+                                              self._stop),
+                                        daemon=True)
+        self._thread.start()
+
+    def _release(self):
+        if self._held is not None:
+            self._free.put(self._held)
+            self._held = None
+
+    def _next(self):
+        if self._closed:
+            return _DONE
+        self._release()
+        item = self._ready.get()
+        if item is _DONE:
+            self.close()
+            return _DONE
+        if isinstance(item, _Failure):
+            self.close()
+            raise item.exc
+        i, size = item
+        self._held = i
+        tensor = self._buffers[i]
+        return tensor if size == self.batch_size else tensor[:size]
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        tensor = self._next()
+        if tensor is _DONE:
+            raise StopIteration
+        return tensor
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        loop = asyncio.get_running_loop()
+        tensor = await loop.run_in_executor(None, self._next)
+        if tensor is _DONE:
+            raise StopAsyncIteration
+        return tensor
+
+    def close(self, timeout: Optional[float] = 1.):
+        # the stop is only noticed between batches, a source blocked in
+        # `next()` would hang the join, the daemon thread is left behind then
+        if self._closed:
+            return
+        self._closed = True
+        self._stop.set()
+        self._release()
+        if threading.current_thread() is not self._thread:
+            self._thread.join(timeout)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        self.close()
+
+    def __del__(self):
+        # signal only, joining from a finalizer could block the collector
+        if hasattr(self, "_thread") and not self._closed:
+            self._closed = True
+            self._stop.set()
@@ -0,0 +1,117 @@
+from typing import Iterable, Optional, Sequence, Type
+
+from .adapters import _adapters, _numpy_adapter
+from .core import _from_tensor, _write_batch
+from .layout import TensorLayout
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class ReplayBuffer:
+    """
+    Fixed-capacity ring of encoded dataclass instances. Instances are encoded
+    once when added, sampling gathers rows of the storage with a single
+    fancy-indexing operation. See example:
+
+    buffer = ReplayBuffer(Chess, 100_000)
+    buffer.extend(states)
+    batch = buffer.sample(256)
+
+    Storage is a NumPy array of shape `(capacity, len(layout))`, or a memmap
+    backed `.npy` file when `filename` is given. With `prioritized=True`
+    rows are sampled proportionally to priorities set with
+    `update_priorities`, new rows get the highest priority seen so far.
+    """
+
+    def __init__(self,
+                 cls: type,
+                 capacity: int,
+                 *,
+                 tensor_layout: Optional[Type[TensorLayout]] = None,
+                 dtype = None,
+                 target: str = "torch",
+                 filename: Optional[str] = None,
+                 prioritized: bool = False,
+                 seed: Optional[int] = None):
+        if np is None:
+            raise RuntimeError("numpy library is not installed")
+        if capacity < 1:
+            raise ValueError("capacity should be positive")
+        if target not in _adapters:
+            raise ValueError(f"{target} is not a supported target")
+        self.cls = cls
+        self.capacity = capacity
+        self._adapter = _adapters[target]
+        self._layout = tensor_layout or cls.tensor_layout()
+        shape = (capacity, len(self._layout))
+        dtype = cls._resolve_dtype(dtype)
+        if filename is None:
+            self.storage = _numpy_adapter.zeros(shape, dtype=dtype)
+        else:
+            self.storage = np.lib.format.open_memmap(filename,
+                                                     mode="w+",
+                                                     dtype=dtype,
+                                                     shape=shape)
+        self.priorities = np.zeros(capacity) if prioritized else None
+        self._max_priority = 1.
+        self._rng = np.random.default_rng(seed)
+        self._cursor = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def add(self, obj) -> int:
+        return int(self.extend([obj])[0])
+
+    def extend(self, objs: Iterable) -> Sequence[int]:
+        objs = list(objs)
+        # only the last `capacity` instances would survive anyway
+        skipped = max(0, len(objs) - self.capacity)
+        objs = objs[skipped:]
+        # encode aside so a failing instance leaves the ring untouched
+        rows = _numpy_adapter.zeros((len(objs), len(self._layout)),
+                                    dtype=self.storage.dtype)
+        _write_batch(_numpy_adapter, self._layout, rows, objs)
+        start = (self._cursor + skipped) % self.capacity
+        indices = (start + np.arange(len(objs))) % self.capacity
+        self.storage[indices] = rows
+        self._cursor = (start + len(objs)) % self.capacity
+        if self.priorities is not None:
+            self.priorities[indices] = self._max_priority
+        self._size = min(self.capacity, self._size + len(objs))
+        return indices
+
+    def update_priorities(self, indices, priorities):
+        if self.priorities is None:
+            raise ValueError("Replay buffer is not prioritized")
+        priorities = np.asarray(priorities, dtype=self.priorities.dtype)
+        if priorities.size == 0:
+            return
+        if (priorities <= 0).any():
+            raise ValueError("Priorities should be positive")
+        self.priorities[indices] = priorities
+        self._max_priority = max(self._max_priority, priorities.max())
+
+    def sample_indices(self, n: int):
+        if self._size == 0:
+            raise ValueError("Replay buffer is empty")
+        if self.priorities is None:
+            return self._rng.integers(0, self._size, size=n)
+        p = self.priorities[:self._size]
+        return self._rng.choice(self._size, size=n, p=p/p.sum())
+
+    def gather(self, indices):
+        return self._adapter.from_numpy(self.storage[indices])
+
+    def sample(self, n: int):
+        return self.gather(self.sample_indices(n))
+
+    def decode(self, indices):
+        # a single index, e.g. returned by `add`, decodes a single instance
+        return _from_tensor(_numpy_adapter,
+                            self._layout,
+                            self.storage[indices],
+                            batch=np.ndim(indices) > 0)
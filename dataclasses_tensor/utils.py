@@ -1,8 +1,10 @@
 import inspect
 import sys
+import threading
 
+from collections import OrderedDict
 from functools import wraps
-from typing import Any, List, Optional, Union
+from typing import Any, List, NamedTuple, Optional, Union
 
 class hybridmethod:
     def __init__(self, func):
@@ -17,6 +19,64 @@ class hybridmethod:
         hybrid.__self__ = hybrid.im_self = obj or cls
         return hybrid
 
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+class LRUCache:
+    # bounded mapping that evicts least recently used keys, thread-safe
+    # as layouts might be shared with prefetching threads
+    def __init__(self, maxsize: int):
+        if maxsize < 1:
+            raise ValueError("Cache size should be positive")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                val = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return val
+
+    def put(self, key, val):
+        with self._lock:
+            self._data[key] = val
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __getstate__(self):
+        # locks can't be pickled, e.g. when sending a layout to workers
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def __repr__(self):
+        return f"LRUCache({self.cache_info()})"
+
 def _get_type_cons(type_):
     if sys.version_info.minor == 6:
         try:
@@ -1,7 +1,10 @@
-from dataclasses import dataclass
+import numpy as np
+
+from dataclasses import dataclass, field
 from enum import Enum
+from typing import List, Optional, Union
 
-from dataclasses_tensor import dataclass_tensor
+from dataclasses_tensor import config, dataclass_tensor
 
 class Movie(Enum):
     THE_MATRIX = 0
@@ -46,3 +49,46 @@ def test_batch_no_size():
     [sr1, sr2] = Watch.from_numpy(b, batch=True)
     assert s1 == sr1
     assert s2 == sr2
+
+@dataclass
+class Rating:
+    score: float
+    movie: Movie
+
+@dataclass_tensor
+@dataclass
+class History:
+    views: int
+    rating: float
+    finished: bool
+    last: Union[int, Movie, Rating]
+    shared: Union[bool, Movie, Rating] = field(metadata=config(union="shared"))
+    best: Rating
+    seasons: List[List[Movie]] = field(metadata=config(shape=(2, 2)))
+    queue: List[Optional[Movie]] = field(metadata=config(shape=(3,)))
+    scores: List[float] = field(metadata=config(shape=(3,)))
+
+HISTORIES = [
+    History(1, 0.5, True, 3, False, Rating(0.125, Movie.THE_MATRIX),
+            [[Movie.THE_MATRIX, Movie.INTERSTELLAR], [Movie.INTERSTELLAR, Movie.THE_MATRIX]],
+            [Movie.THE_DARK_KNIGHT], [0.1, 0.2, 0.3]),
+    History(2, 1.5, False, Movie.INTERSTELLAR, Movie.THE_DARK_KNIGHT, Rating(0.25, Movie.INTERSTELLAR),
+            [[Movie.THE_DARK_KNIGHT, Movie.THE_DARK_KNIGHT], [Movie.THE_MATRIX, Movie.INTERSTELLAR]],
+            [None, Movie.INTERSTELLAR, Movie.THE_MATRIX], [0.4, 0.5, 0.6]),
+    History(3, 2.5, True, Rating(0.375, Movie.THE_DARK_KNIGHT), Rating(0.5, Movie.THE_MATRIX),
+            Rating(0.625, Movie.THE_DARK_KNIGHT),
+            [[Movie.INTERSTELLAR, Movie.THE_MATRIX], [Movie.THE_DARK_KNIGHT, Movie.THE_MATRIX]],
+            [], [0.7, 0.8, 0.9]),
+]
+
+def test_batch_matches_rows():
+    b = History.to_numpy(HISTORIES, batch=True)
+    rows = np.stack([h.to_numpy() for h in HISTORIES])
+    np.testing.assert_array_equal(b, rows)
+    bt = History.to_torch(HISTORIES, batch=True)
+    np.testing.assert_array_equal(bt.numpy(), rows)
+    decoded = History.from_numpy(b, batch=True)
+    assert [d.last for d in decoded] == [h.last for h in HISTORIES]
+    assert [d.shared for d in decoded] == [h.shared for h in HISTORIES]
+    assert [d.seasons for d in decoded] == [h.seasons for h in HISTORIES]
+    assert [d.queue for d in decoded] == [h.queue + [None]*(3-len(h.queue)) for h in HISTORIES]
@@ -0,0 +1,65 @@
+import numpy as np
+import torch
+
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import List, Optional, Union
+
+from dataclasses_tensor import (OptionalColumns, UnionColumns, config,
+                                dataclass_tensor)
+
+class Player(Enum):
+    WHITE = 0
+    BLACK = 1
+
+class PieceType(Enum):
+    PAWN = 0
+    KING = 1
+
+@dataclass
+class Piece:
+    piece_type: PieceType
+    owner: Player
+
+@dataclass_tensor
+@dataclass
+class Chess:
+    num_moves: int
+    next_move: Player
+    board: List[Optional[Piece]] = field(metadata=config(shape=(3,)))
+    winner: Union[Player, bool] = False
+
+STATES = [
+    Chess(1, Player.WHITE, [Piece(PieceType.KING, Player.BLACK), None, None]),
+    Chess(2, Player.BLACK, [None, Piece(PieceType.PAWN, Player.WHITE), None], Player.BLACK),
+]
+
+def test_columnar_batch():
+    t1 = Chess.to_numpy(STATES, batch=True)
+    columns = Chess.from_numpy(t1, batch=True, columnar=True)
+    assert list(columns.keys()) == ["num_moves", "next_move", "board", "winner"]
+    assert columns["num_moves"].tolist() == [1, 2]
+    assert columns["next_move"].tolist() == [0, 1]
+    board = columns["board"]
+    assert isinstance(board, OptionalColumns)
+    assert board.mask.tolist() == [[False, True, True], [True, False, True]]
+    assert board.value["piece_type"].shape == (2, 3)
+    assert board.value["piece_type"][~board.mask].tolist() == [1, 0]
+    assert board.value["owner"][~board.mask].tolist() == [1, 0]
+    winner = columns["winner"]
+    assert isinstance(winner, UnionColumns)
+    assert winner.selector.tolist() == [1, 0]
+    assert winner.options[0][1] == 1
+    assert not winner.options[1][0]
+
+def test_columnar_torch():
+    t1 = Chess.to_torch(STATES, batch=True)
+    columns = Chess.from_torch(t1, batch=True, columnar=True)
+    assert columns["num_moves"].dtype == torch.int64
+    assert columns["board"].mask.tolist() == [[False, True, True], [True, False, True]]
+
+def test_columnar_single():
+    columns = Chess.from_numpy(STATES[0].to_numpy(), columnar=True)
+    assert columns["next_move"] == 0
+    assert columns["board"].value["owner"].shape == (3,)
+    assert np.array_equal(columns["board"].mask, [False, True, True])
@@ -0,0 +1,68 @@
+import pickle
+import torch
+
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import List, Optional
+from torch.utils.data import DataLoader
+
+from dataclasses_tensor import (TensorDataset, TensorIterableDataset,
+                                config, dataclass_tensor, make_collate)
+
+class Movie(Enum):
+    THE_MATRIX = 0
+    THE_DARK_KNIGHT = 1
+    INTERSTELLAR = 2
+
+@dataclass_tensor
+@dataclass
+class Watch:
+    rating: float
+    movies: List[Optional[Movie]] = field(metadata=config(shape=(2,)))
+
+WATCHES = [Watch(float(i), [list(Movie)[i % 3], None]) for i in range(10)]
+
+def test_collate():
+    collate = make_collate(Watch)
+    b = collate(WATCHES[:4])
+    assert b.shape == (4, 9)
+    assert torch.equal(b, Watch.to_torch(WATCHES[:4], batch=True))
+    assert Watch.from_torch(b, batch=True) == WATCHES[:4]
+    assert torch.equal(pickle.loads(pickle.dumps(collate))(WATCHES[:4]), b)
+
+def test_dataset_loader():
+    dataset = TensorDataset(WATCHES, Watch)
+    loader = DataLoader(dataset, batch_size=4, collate_fn=dataset.collate_fn)
+    decoded = []
+    for b in loader:
+        decoded.extend(Watch.from_torch(b, batch=True))
+    assert decoded == WATCHES
+
+def test_iterable_dataset_sharding():
+    dataset = TensorIterableDataset(WATCHES, Watch)
+    loader = DataLoader(dataset,
+                        batch_size=2,
+                        num_workers=2,
+                        collate_fn=dataset.collate_fn)
+    decoded = []
+    for b in loader:
+        decoded.extend(Watch.from_torch(b, batch=True))
+    assert sorted(decoded, key=lambda w: w.rating) == WATCHES
+
+@dataclass(frozen=True)
+class Rating:
+    movie: Movie
+    liked: bool
+
+@dataclass_tensor
+@dataclass
+class Ratings:
+    ratings: List[Optional[Rating]] = field(metadata=config(shape=(2,), cache=4, intern=4))
+
+def test_collate_cached_layout_pickle():
+    collate = make_collate(Ratings)
+    s1 = Ratings([Rating(Movie.THE_MATRIX, True), None])
+    b1 = collate([s1, s1])
+    collate2 = pickle.loads(pickle.dumps(collate))
+    assert torch.equal(collate2([s1, s1]), b1)
+    assert Ratings.from_torch(b1, batch=True, tensor_layout=collate2.layout) == [s1, s1]
@@ -2,9 +2,10 @@ import pytest
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from dataclasses_tensor import dataclass_tensor, config 
+from dataclasses_tensor.adapters import _pytorch_adapter
 
 class Player(Enum):
     WHITE = 0
@@ -60,3 +61,188 @@ def test_unsupported_type_failure():
 
     with pytest.raises(ValueError):
         Unsupported.tensor_layout()
+
+@dataclass(frozen=True)
+class FrozenPiece:
+    piece_type: PieceType
+    owner: Player
+
+@dataclass
+class MutablePiece:
+    piece_type: PieceType
+    owner: Player
+
+@dataclass(frozen=True)
+class FrozenHand:
+    pieces: List[PieceType] = field(metadata=config(shape=(2,)))
+
+@dataclass_tensor
+@dataclass
+class HandsCached:
+    hands: List[FrozenHand] = field(metadata=config(shape=(2,), cache=2))
+
+def test_dataclass_cache():
+    # own class, layouts and so cache statistics are kept per class
+    @dataclass_tensor
+    @dataclass
+    class ChessCached:
+        board: List[Optional[FrozenPiece]] = field(metadata=config(shape=(4,), cache=2))
+
+    layout = ChessCached.tensor_layout()
+    piece_layout = layout.elems["board"].elem.elem
+    king = FrozenPiece(PieceType.KING, Player.WHITE)
+    queen = FrozenPiece(PieceType.QUEEN, Player.BLACK)
+    s1 = ChessCached([king, queen, king, None])
+    t1 = s1.to_numpy(tensor_layout=layout)
+    assert ChessCached.from_numpy(t1) == s1
+    # one lookup per distinct piece over the whole board
+    assert piece_layout.cache_info().hits == 0
+    assert piece_layout.cache_info().misses == 2
+
+    b1 = ChessCached.to_numpy([s1, s1], batch=True, tensor_layout=layout)
+    assert ChessCached.from_numpy(b1, batch=True) == [s1, s1]
+    assert piece_layout.cache_info().hits == 2
+    assert piece_layout.cache_info().currsize == 2
+
+    pawn = FrozenPiece(PieceType.PAWN, Player.WHITE)
+    ChessCached([pawn]).to_numpy(tensor_layout=layout)
+    assert piece_layout.cache_info().currsize == 2
+    assert piece_layout.cache_info().misses == 3
+
+def test_dataclass_cache_unhashable():
+    layout = HandsCached.tensor_layout()
+    s1 = HandsCached([FrozenHand([PieceType.KING, PieceType.PAWN])]*2)
+    assert HandsCached.from_numpy(s1.to_numpy(tensor_layout=layout)) == s1
+    b1 = HandsCached.to_numpy([s1], batch=True, tensor_layout=layout)
+    assert HandsCached.from_numpy(b1, batch=True) == [s1]
+    assert layout.elems["hands"].elem.cache_info().currsize == 0
+
+def test_dataclass_cache_mutable_failure():
+    @dataclass_tensor
+    @dataclass
+    class ChessMutableCached:
+        board: List[Optional[MutablePiece]] = field(metadata=config(shape=(4,), cache=2))
+
+    with pytest.raises(ValueError):
+        ChessMutableCached.tensor_layout()
+
+@dataclass(eq=False)
+class Square:
+    piece_type: PieceType
+
+@dataclass(frozen=True)
+class Move:
+    square: Square
+
+@dataclass_tensor
+@dataclass
+class MovesCached:
+    moves: List[Move] = field(metadata=config(shape=(1,), cache=2))
+
+def test_dataclass_cache_nested_mutable():
+    square = Square(PieceType.PAWN)
+    s1 = MovesCached([Move(square)])
+    s1.to_numpy()
+    square.piece_type = PieceType.KING
+    assert MovesCached.from_numpy(s1.to_numpy()).moves[0].square.piece_type == PieceType.KING
+    [s2] = MovesCached.from_numpy(MovesCached.to_numpy([s1], batch=True), batch=True)
+    assert s2.moves[0].square.piece_type == PieceType.KING
+
+@dataclass(frozen=True)
+class Score:
+    value: Union[bool, int]
+
+@dataclass_tensor
+@dataclass
+class ScoresCached:
+    scores: List[Score] = field(metadata=config(shape=(2,), cache=8))
+
+def test_dataclass_cache_exact_types():
+    layout = ScoresCached.tensor_layout()
+    s1 = ScoresCached([Score(True), Score(1)])
+    assert ScoresCached.from_numpy(s1.to_numpy(tensor_layout=layout)) == s1
+    assert type(ScoresCached.from_numpy(s1.to_numpy(tensor_layout=layout)).scores[1].value) is int
+    b1 = ScoresCached.to_numpy([s1], batch=True, tensor_layout=layout)
+    [s2] = ScoresCached.from_numpy(b1, batch=True)
+    assert [type(score.value) for score in s2.scores] == [bool, int]
+
+def test_dataclass_intern():
+    # own class, layouts and so intern statistics are kept per class
+    @dataclass_tensor
+    @dataclass
+    class ChessInterned:
+        board: List[Optional[FrozenPiece]] = field(metadata=config(shape=(4,), intern=8))
+
+    layout = ChessInterned.tensor_layout()
+    king = FrozenPiece(PieceType.KING, Player.WHITE)
+    s1 = ChessInterned([king, FrozenPiece(PieceType.KING, Player.WHITE), king, None])
+    b1 = ChessInterned.to_torch([s1]*3, batch=True)
+    decoded = ChessInterned.from_torch(b1, batch=True, tensor_layout=layout)
+    assert decoded == [s1]*3
+    boards = [s.board for s in decoded]
+    assert all(piece is boards[0][0] for board in boards for piece in board[:3])
+    info = layout.elems["board"].elem.elem.intern_info()
+    assert info.misses == 1
+    assert info.hits == 8
+
+def test_dataclass_intern_mutable_failure():
+    @dataclass_tensor
+    @dataclass
+    class ChessMutableInterned:
+        board: List[Optional[MutablePiece]] = field(metadata=config(shape=(4,), intern=8))
+
+    with pytest.raises(ValueError):
+        ChessMutableInterned.tensor_layout()
+
+def test_dataclass_intern_torch_grad():
+    import torch
+
+    @dataclass_tensor
+    @dataclass
+    class ChessInterned:
+        board: List[Optional[FrozenPiece]] = field(metadata=config(shape=(4,), intern=8))
+
+    layout = ChessInterned.tensor_layout()
+    king = FrozenPiece(PieceType.KING, Player.WHITE)
+    s1 = ChessInterned([king, None, king, None])
+    for dtype in (torch.float32, torch.bfloat16):
+        t1 = ChessInterned.to_torch(s1, dtype=dtype).requires_grad_(True)
+        assert ChessInterned.from_torch(t1, tensor_layout=layout) == s1
+        [decoded] = ChessInterned.from_torch(t1.unsqueeze(0), batch=True, tensor_layout=layout)
+        assert decoded == s1
+        assert layout.read(_pytorch_adapter, 0, t1) == s1
+        rows = (t for t in [t1, t1])
+        assert ChessInterned.from_torch(rows, batch=True, tensor_layout=layout) == [s1, s1]
+
+def test_dataclass_torch_single_host_copy(monkeypatch):
+    import torch
+
+    @dataclass_tensor
+    @dataclass
+    class Chess:
+        board: List[Optional[FrozenPiece]] = field(metadata=config(shape=(2,)))
+
+    s1 = Chess([FrozenPiece(PieceType.KING, Player.WHITE), None])
+    b1 = Chess.to_torch([s1]*3, batch=True)
+    calls = []
+    cpu = torch.Tensor.cpu
+    monkeypatch.setattr(torch.Tensor, "cpu", lambda t: calls.append(t) or cpu(t))
+    assert Chess.from_torch(b1, batch=True) == [s1]*3
+    assert len(calls) == 1
+
+def test_dataclass_intern_predictions():
+    @dataclass_tensor
+    @dataclass
+    class ChessInterned:
+        board: List[Optional[FrozenPiece]] = field(metadata=config(shape=(4,), intern=8))
+
+    layout = ChessInterned.tensor_layout()
+    king = FrozenPiece(PieceType.KING, Player.WHITE)
+    s1 = ChessInterned([king, None, king, None])
+    t1 = s1.to_numpy(tensor_layout=layout)
+    # segments differ in bytes, but decode into the same values
+    predictions = [t1*0.9 + 0.01*i for i in range(3)]
+    assert ChessInterned.from_numpy(predictions, batch=True, tensor_layout=layout) == [s1]*3
+    info = layout.elems["board"].elem.elem.intern_info()
+    assert info.misses == 1
+    assert info.hits == 5
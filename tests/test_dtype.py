@@ -1,8 +1,10 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
+from typing import List, Optional
 
-from dataclasses_tensor import dataclass_tensor
+from dataclasses_tensor import config, dataclass_tensor
 import numpy as np
+import pytest
 
 class Movie(Enum):
     THE_MATRIX = 0
@@ -37,3 +39,93 @@ def test_numpy_dtype_class():
     assert s1 == WatchDtype.from_numpy(t1)
     assert t1.dtype == np.float32
 
+
+@dataclass
+class Rating:
+    movie: Movie
+    score: float = field(metadata=config(dtype="float64"))
+
+@dataclass_tensor
+@dataclass
+class WatchMixed:
+    num_views: int = field(metadata=config(dtype="int64"))
+    next_movie: Movie = field(metadata=config(dtype="uint8"))
+    seen: List[Movie] = field(metadata=config(shape=(2,), dtype="uint8"))
+    rating: Rating
+    rewatch: bool
+
+def test_numpy_multi_buffer():
+    s1 = WatchMixed(2**40, Movie.THE_MATRIX, [Movie.INTERSTELLAR, Movie.THE_MATRIX],
+                    Rating(Movie.THE_DARK_KNIGHT, 0.1), True)
+    buffers = s1.to_numpy(multi_buffer=True)
+    assert list(buffers.keys()) == ["int64", "uint8", "float32", "float64"]
+    assert buffers["int64"].dtype == np.int64
+    assert buffers["uint8"].shape == (9,)
+    assert buffers["float32"].shape == (4,)
+    assert buffers["float64"].tolist() == [0.1]
+    assert WatchMixed.from_numpy(buffers) == s1
+
+def test_torch_multi_buffer_batch():
+    s1 = WatchMixed(1, Movie.THE_MATRIX, [Movie.INTERSTELLAR, Movie.THE_MATRIX],
+                    Rating(Movie.THE_DARK_KNIGHT, 0.1), True)
+    s2 = WatchMixed(2, Movie.INTERSTELLAR, [Movie.THE_MATRIX, Movie.THE_MATRIX],
+                    Rating(Movie.THE_MATRIX, 0.5), False)
+    buffers = WatchMixed.to_torch([s1, s2], batch=True, dtype="int32", multi_buffer=True)
+    assert buffers["uint8"].shape == (2, 9)
+    assert buffers["int32"].shape == (2, 4)
+    assert WatchMixed.from_torch(buffers, batch=True, dtype="int32") == [s1, s2]
+    assert WatchMixed.from_torch(buffers, batch=True) == [s1, s2]
+
+def test_multi_buffer_dtype_mismatch_failure():
+    s1 = WatchMixed(1, Movie.THE_MATRIX, [Movie.INTERSTELLAR, Movie.THE_MATRIX],
+                    Rating(Movie.THE_DARK_KNIGHT, 0.1), True)
+    buffers = s1.to_numpy(multi_buffer=True)
+    del buffers["float64"]
+    with pytest.raises(ValueError, match="float64"):
+        WatchMixed.from_numpy(buffers)
+
+@dataclass
+class Views:
+    count: int = field(metadata=config(dtype="int64"))
+
+def test_multi_buffer_nested_dtype_failure():
+    @dataclass_tensor
+    @dataclass
+    class History:
+        views: List[Optional[Views]] = field(metadata=config(shape=(2,), dtype="uint8"))
+
+    with pytest.raises(ValueError):
+        History([Views(1), None]).to_numpy(multi_buffer=True)
+
+    @dataclass_tensor
+    @dataclass
+    class HistoryMatching:
+        views: List[Optional[Views]] = field(metadata=config(shape=(2,), dtype="int64"))
+
+    s1 = HistoryMatching([Views(2**40), None])
+    buffers = s1.to_numpy(multi_buffer=True)
+    assert list(buffers.keys()) == ["int64"]
+    assert HistoryMatching.from_numpy(buffers) == s1
+
+@dataclass_tensor
+@dataclass
+class WatchSpecs:
+    next_movie: Movie = field(metadata=config(dtype="uint8"))
+    last_movie: Movie = field(metadata=config(dtype=np.uint8))
+    rating: float
+
+def test_multi_buffer_dtype_specs():
+    import torch
+
+    s1 = WatchSpecs(Movie.THE_MATRIX, Movie.INTERSTELLAR, 0.5)
+    buffers = s1.to_numpy(multi_buffer=True)
+    assert list(buffers.keys()) == ["uint8", "float32"]
+    assert buffers["uint8"].shape == (6,)
+    assert WatchSpecs.from_numpy(buffers) == s1
+    buffers = s1.to_torch(multi_buffer=True, dtype=torch.float64)
+    assert list(buffers.keys()) == ["uint8", "float64"]
+    assert buffers["uint8"].dtype == torch.uint8
+    assert WatchSpecs.from_torch(buffers) == s1
+    assert WatchSpecs.from_torch(buffers, dtype=np.float64) == s1
+    buffers = {torch.uint8: buffers["uint8"], torch.float64: buffers["float64"]}
+    assert WatchSpecs.from_torch(buffers) == s1
@@ -0,0 +1,92 @@
+import asyncio
+import gc
+import threading
+import time
+import pytest
+
+from dataclasses import dataclass
+from enum import Enum
+
+from dataclasses_tensor import BatchPrefetcher, dataclass_tensor
+
+class Movie(Enum):
+    THE_MATRIX = 0
+    THE_DARK_KNIGHT = 1
+    INTERSTELLAR = 2
+
+@dataclass_tensor
+@dataclass
+class Watch:
+    next_movie: Movie
+
+def generate_watches(n):
+    movies = list(Movie)
+    for i in range(n):
+        yield Watch(movies[i % len(movies)])
+
+def test_prefetch_batches():
+    decoded = []
+    with BatchPrefetcher(generate_watches(7), Watch, 3, target="numpy") as batches:
+        for b in batches:
+            assert b.shape[1] == 3
+            decoded.extend(Watch.from_numpy(b, batch=True))
+    assert decoded == list(generate_watches(7))
+
+def test_prefetch_buffers_reused():
+    batches = BatchPrefetcher(generate_watches(6), Watch, 2, depth=2, target="numpy")
+    b1, b2, b3 = [b for b in batches]
+    assert b1 is b3
+    assert b1 is not b2
+
+def test_prefetch_async():
+    async def consume():
+        decoded = []
+        async for b in BatchPrefetcher(generate_watches(5), Watch, 2, target="numpy"):
+            decoded.extend(Watch.from_numpy(b, batch=True))
+        return decoded
+
+    assert asyncio.run(consume()) == list(generate_watches(5))
+
+def test_prefetch_error_propagation():
+    def failing():
+        yield from generate_watches(2)
+        raise RuntimeError("broken source")
+
+    batches = BatchPrefetcher(failing(), Watch, 2, target="numpy")
+    assert next(batches).shape == (2, 3)
+    with pytest.raises(RuntimeError):
+        next(batches)
+
+def test_prefetch_close():
+    batches = BatchPrefetcher(generate_watches(1000), Watch, 2, target="numpy")
+    next(batches)
+    batches.close()
+    assert not batches._thread.is_alive()
+    with pytest.raises(StopIteration):
+        next(batches)
+
+def test_prefetch_abandoned():
+    batches = BatchPrefetcher(generate_watches(1000), Watch, 2, depth=1, target="numpy")
+    next(batches)
+    thread = batches._thread
+    del batches
+    gc.collect()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+
+def test_prefetch_close_blocked_source():
+    release = threading.Event()
+
+    def blocking():
+        yield from generate_watches(2)
+        release.wait()
+        yield from generate_watches(2)
+
+    batches = BatchPrefetcher(blocking(), Watch, 2, target="numpy")
+    next(batches)
+    start = time.monotonic()
+    batches.close(timeout=0.1)
+    assert time.monotonic() - start < 1
+    release.set()
+    batches._thread.join(timeout=5)
+    assert not batches._thread.is_alive()
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import List, Optional
+
+from dataclasses_tensor import config, dataclass_tensor
+
+class Player(Enum):
+    WHITE = 0
+    BLACK = 1
+
+@dataclass_tensor
+@dataclass
+class Game:
+    num_moves: float
+    next_move: Player
+    players: List[List[Optional[Player]]] = field(metadata=config(shape=(2, 2)))
+
+GAMES = [
+    Game(1., Player.WHITE, [[Player.BLACK, None], [None, None]]),
+    Game(2., Player.BLACK, [[None, None], [Player.WHITE, Player.WHITE]]),
+]
+
+def test_records():
+    r1 = GAMES[0].to_records()
+    assert r1.shape == ()
+    assert r1.dtype.names == ("num_moves", "next_move", "players")
+    assert r1["players"].shape == (2, 2, 3)
+    assert Game.from_records(r1) == GAMES[0]
+
+def test_batch_records(tmp_path):
+    r1 = Game.to_records(GAMES, batch=True, dtype="int8")
+    assert r1.shape == (2,)
+    assert r1["num_moves"].tolist() == [1, 2]
+    assert r1["next_move"].dtype == np.int8
+    np.save(tmp_path / "games.npy", r1)
+    r2 = np.load(tmp_path / "games.npy")
+    assert Game.from_records(r2) == GAMES
+    assert Game.from_records(r2[::-1]) == GAMES[::-1]
+
+def test_records_fields_mismatch_failure():
+    r1 = np.zeros(2, dtype=[("num_moves", "float32")])
+    with pytest.raises(ValueError):
+        Game.from_records(r1)
+
+def test_records_shape_mismatch_failure():
+    r1 = np.zeros(2, dtype=[("num_moves", "f4"), ("next_move", "f4", (5,)), ("players", "f4", (2, 2, 3))])
+    with pytest.raises(ValueError):
+        Game.from_records(r1)
+
+def test_records_mixed_dtypes_failure():
+    r1 = np.zeros(2, dtype=[("num_moves", "f8"), ("next_move", "f4", (2,)), ("players", "f4", (2, 2, 3))])
+    with pytest.raises(ValueError):
+        Game.from_records(r1)
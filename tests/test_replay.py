@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+import torch
+
+from dataclasses import dataclass
+from enum import Enum
+
+from dataclasses_tensor import ReplayBuffer, dataclass_tensor
+
+class Movie(Enum):
+    THE_MATRIX = 0
+    THE_DARK_KNIGHT = 1
+    INTERSTELLAR = 2
+
+@dataclass_tensor
+@dataclass
+class Watch:
+    rating: float
+    next_movie: Movie
+
+WATCHES = [Watch(float(i), list(Movie)[i % 3]) for i in range(5)]
+
+def test_replay_ring():
+    buffer = ReplayBuffer(Watch, 3, target="numpy")
+    assert buffer.add(WATCHES[0]) == 0
+    assert len(buffer) == 1
+    assert buffer.extend(WATCHES[1:3]).tolist() == [1, 2]
+    assert buffer.extend(WATCHES).tolist() == [2, 0, 1]
+    assert len(buffer) == 3
+    assert buffer.decode([0, 1, 2]) == [WATCHES[3], WATCHES[4], WATCHES[2]]
+    assert buffer.decode(buffer.add(WATCHES[0])) == WATCHES[0]
+
+def test_replay_sample():
+    buffer = ReplayBuffer(Watch, 10, seed=0)
+    buffer.extend(WATCHES)
+    batch = buffer.sample(8)
+    assert isinstance(batch, torch.Tensor)
+    assert batch.shape == (8, 4)
+    for w in Watch.from_torch(batch, batch=True):
+        assert w in WATCHES
+
+def test_replay_prioritized():
+    buffer = ReplayBuffer(Watch, 10, target="numpy", prioritized=True, seed=0)
+    buffer.extend(WATCHES)
+    buffer.update_priorities([0, 1, 2, 3], [1e-9]*4)
+    indices = buffer.sample_indices(100)
+    assert (indices == 4).mean() > 0.99
+    with pytest.raises(ValueError):
+        buffer.update_priorities([0], [0.])
+    buffer.update_priorities([], [])
+
+def test_replay_memmap(tmp_path):
+    filename = str(tmp_path / "replay.npy")
+    buffer = ReplayBuffer(Watch, 10, target="numpy", filename=filename)
+    buffer.extend(WATCHES)
+    buffer.storage.flush()
+    storage = np.load(filename)
+    assert Watch.from_numpy(storage[:5], batch=True) == WATCHES
+
+def test_replay_empty_failure():
+    with pytest.raises(ValueError):
+        ReplayBuffer(Watch, 10).sample(1)
+
+def test_replay_extend_failure():
+    buffer = ReplayBuffer(Watch, 3, target="numpy")
+    buffer.extend(WATCHES[:3])
+    with pytest.raises(ValueError):
+        buffer.extend([WATCHES[3], Watch(5., "not a movie")])
+    assert len(buffer) == 3
+    assert buffer.decode([0, 1, 2]) == WATCHES[:3]
+    assert buffer.add(WATCHES[4]) == 0
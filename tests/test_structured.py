@@ -0,0 +1,59 @@
+import numpy as np
+
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import List, Optional
+
+from dataclasses_tensor import config, dataclass_tensor
+
+class Player(Enum):
+    WHITE = 0
+    BLACK = 1
+
+class PieceType(Enum):
+    PAWN = 0
+    KING = 1
+
+@dataclass
+class Piece:
+    piece_type: PieceType
+    owner: Player
+
+@dataclass_tensor
+@dataclass
+class Chess:
+    num_moves: float
+    next_move: Player
+    board: List[List[Optional[Piece]]] = field(metadata=config(shape=(8, 8)))
+
+def make_state():
+    board = [[None]*8 for _ in range(8)]
+    board[0][4] = Piece(PieceType.KING, Player.WHITE)
+    return Chess(10., Player.BLACK, board)
+
+def test_structured_views():
+    s1 = make_state()
+    t1, views = s1.to_numpy(structured=True)
+    assert t1.shape == (1 + 2 + 64*5,)
+    assert views["num_moves"].shape == ()
+    assert views["next_move"].shape == (2,)
+    assert views["board"].shape == (8, 8, 5)
+    assert views["board"][0, 4].tolist() == [0., 0., 1., 1., 0.]
+    for view in views.values():
+        assert np.shares_memory(view, t1)
+    views["num_moves"][...] = 20.
+    assert Chess.from_numpy(t1).num_moves == 20.
+
+def test_structured_batch_views():
+    s1 = make_state()
+    st = Chess.to_numpy([s1, s1, s1], batch=True, structured=True)
+    assert st.fields["num_moves"].shape == (3,)
+    assert st.fields["board"].shape == (3, 8, 8, 5)
+    assert np.shares_memory(st.fields["board"], st.tensor)
+    assert Chess.from_numpy(st, batch=True) == [s1, s1, s1]
+
+def test_structured_torch_views():
+    s1 = make_state()
+    t1, views = s1.to_torch(structured=True)
+    assert tuple(views["board"].shape) == (8, 8, 5)
+    assert views["board"].data_ptr() == t1[3:].data_ptr()
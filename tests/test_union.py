@@ -1,10 +1,10 @@
 import pytest
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Union
 
-from dataclasses_tensor import dataclass_tensor
+from dataclasses_tensor import config, dataclass_tensor
 
 class Matrix(Enum):
     THE_MATRIX = 0
@@ -47,3 +47,34 @@ def test_invalid_value_failure():
     with pytest.raises(ValueError):
         Watch(Watched.I_AM_LEGEND).to_numpy()
 
+
+@dataclass
+class Rating:
+    movie: Matrix
+    liked: bool
+
+@dataclass_tensor
+@dataclass
+class WatchShared:
+    seen: bool
+    next_movie: Union[Rating, Rings, Batman] = field(metadata=config(union="shared"))
+
+def test_shared_union():
+    assert len(WatchShared.tensor_layout()) == 1 + 3 + 4
+
+    s1 = WatchShared(True, Rating(Matrix.THE_REVOLUTIONS, False))
+    t1 = s1.to_numpy()
+    assert WatchShared.from_numpy(t1) == s1
+
+    s2 = WatchShared(False, Batman.BEGINS)
+    t2 = s2.to_numpy()
+    assert WatchShared.from_numpy(t2) == s2
+
+def test_invalid_union_layout_failure():
+    @dataclass_tensor
+    @dataclass
+    class WatchInvalid:
+        next_movie: Union[Matrix, Rings] = field(metadata=config(union="packed"))
+
+    with pytest.raises(ValueError):
+        WatchInvalid.tensor_layout()